@@ -1,16 +1,21 @@
 """Module for working with colours."""
 
+from __future__ import annotations
+
+import functools
 import inspect
 import sys
-from collections.abc import Sequence
-from typing import Literal, overload
+from collections.abc import Iterable, Sequence
+from typing import TYPE_CHECKING, Literal, TypeGuard, overload
 
 import cmcrameri  # noqa
 import matplotlib as mpl
-import matplotlib.pyplot as plt
 import numpy as np
-import palettable  # noqa
-import pywaffle
+
+if TYPE_CHECKING:
+    import matplotlib.axes
+
+_HEX_DIGITS = np.frombuffer(b"0123456789abcdef", dtype=np.uint8)
 
 
 @overload
@@ -128,26 +133,21 @@ def _create_colorlist_from(
         A list of `n` colors in HEX format.
     """
     if cmap_name == "help":
-        try:
-            plt.get_cmap(cmap_name, 1)
-        except Exception as e:
-            s1, s2 = str(e).split(" supported values are ")
-            print("Supported colour names are:")
-            for word in s2.split(", "):
-                word_ = word[1:-1]
-                if word_.startswith("cmc"):
-                    print("\t", word_, "\t(from cmcrameri)")
-                else:
-                    print("\t", word_)
+        print("Supported colour names are:")
+        for word_ in sorted(mpl.colormaps):
+            if word_.startswith("cmc"):
+                print("\t", word_, "\t(from cmcrameri)")
+            else:
+                print("\t", word_)
         sys.exit()
     if map:
-        return plt.get_cmap(cmap_name, n)
-    return [mpl.colors.to_hex(c) for c in plt.get_cmap(cmap_name, n)(range(n))]
+        return _colormap(cmap_name, n).copy()
+    return list(_materialize(cmap_name, n))
 
 
 def _create_colorlist_between(
     colors: Sequence, n: int, map: bool = False
-) -> list[str] | mpl.colors.LinearSegmentedColormap:
+) -> list[str] | mpl.colors.Colormap:
     """Create `n` colors between two colors (inclusive).
 
     Parameters
@@ -169,21 +169,113 @@ def _create_colorlist_between(
 
     Returns
     -------
-    list[str] | mpl.colors.LinearSegmentedColormap
-        The hex values of all generated colors.
+    list[str] | mpl.colors.Colormap
+        The hex values of all generated colors. With ``map=True``, two colours give a
+        ``ListedColormap`` holding the `n` interpolated colours, while three or more
+        give a ``LinearSegmentedColormap``.
     """
+    key = _as_key(colors)
     if map:
-        return mpl.colors.LinearSegmentedColormap.from_list("Custom", colors, N=n)
-    return [
-        mpl.colors.to_hex(c)
-        for c in mpl.colors.LinearSegmentedColormap.from_list("Custom", colors, N=n)(
-            range(n)
-        )
-    ]
+        return _colormap(key, n).copy()
+    return list(_materialize(key, n))
+
+
+def _as_key(colors: Iterable) -> tuple:
+    """Return the colours as a hashable tuple that can be used as a cache key.
+
+    Nested sequences, such as the RGB list in a ``(value, color)`` pair, are turned
+    into tuples at every level.
+    """
+    return tuple(
+        c if isinstance(c, str) or not np.iterable(c) else _as_key(c) for c in colors
+    )
+
+
+@functools.lru_cache(maxsize=32)
+def _colormap(cmap_spec: str | tuple, n: int) -> mpl.colors.Colormap:
+    """Return the colour map with `n` entries described by ``cmap_spec``.
+
+    A ``str`` is looked up among the registered colour maps, while a ``tuple`` of
+    colours is interpolated into a new colour map. The result is cached, so callers
+    that hand it out should return a copy.
+    """
+    if isinstance(cmap_spec, str):
+        try:
+            cmap = mpl.colormaps[cmap_spec]
+        except KeyError as e:
+            names = ", ".join(map(repr, sorted(mpl.colormaps)))
+            raise ValueError(
+                f"{cmap_spec!r} is not a valid value for cmap_name; supported values"
+                f" are {names}"
+            ) from e
+        return cmap.resampled(n)
+    if _is_color_pair(cmap_spec, n):
+        return mpl.colors.ListedColormap(_interpolate_pair(cmap_spec, n), name="Custom")
+    return mpl.colors.LinearSegmentedColormap.from_list("Custom", cmap_spec, N=n)
+
+
+@functools.lru_cache(maxsize=256)
+def _materialize(cmap_spec: str | tuple, n: int) -> tuple[str, ...]:
+    """Return the `n` colours of the colour map ``cmap_spec`` as HEX strings."""
+    if _is_color_pair(cmap_spec, n):
+        # Uniform samples between two colours need no colour map.
+        return _to_hex(_interpolate_pair(cmap_spec, n))
+    return _to_hex(_colormap(cmap_spec, n)(np.arange(n)))
+
+
+def _is_color_pair(cmap_spec: str | tuple, n: int) -> TypeGuard[tuple]:
+    """Return True if ``cmap_spec`` is two plain colours to draw `n` > 1 colours from.
+
+    Lists of ``(value, color)`` pairs and the degenerate sizes are left to
+    ``LinearSegmentedColormap.from_list``.
+    """
+    return (
+        not isinstance(cmap_spec, str)
+        and len(cmap_spec) == 2  # noqa: PLR2004
+        and n > 1
+        and all(mpl.colors.is_color_like(c) for c in cmap_spec)
+    )
+
+
+def _interpolate_pair(colors: tuple, n: int) -> np.ndarray:
+    """Return `n` RGBA colours evenly spaced between two colours (inclusive).
+
+    The arithmetic follows the lookup table that ``LinearSegmentedColormap.from_list``
+    builds for two colours step by step, so the colours are identical to the ones
+    drawn from that colour map, not just equal to within rounding.
+    """
+    c0, c1 = mpl.colors.to_rgba_array(colors)
+    xind = (n - 1) * np.linspace(0, 1, n)
+    inner = (xind[1:-1] / (n - 1))[:, np.newaxis] * (c1 - c0) + c0
+    return np.clip(np.vstack((c0, inner, c1)), 0.0, 1.0)
+
+
+def _to_hex(rgba: np.ndarray) -> tuple[str, ...]:
+    """Convert an ``(n, 3)`` or ``(n, 4)`` array of colours to HEX strings.
+
+    This is a vectorised ``matplotlib.colors.to_hex``, the alpha channel is dropped.
+    Each string is assembled as seven ASCII bytes, with every 4-bit half of a channel
+    looked up in a table of hexadecimal digits.
+    """
+    rgb8 = np.round(np.clip(rgba[:, :3], 0, 1) * 255).astype(np.uint8)
+    chars = np.empty((len(rgb8), 7), dtype=np.uint8)
+    chars[:, 0] = ord("#")
+    chars[:, 1::2] = _HEX_DIGITS[rgb8 >> 4]
+    chars[:, 2::2] = _HEX_DIGITS[rgb8 & 0x0F]
+    return tuple(chars.view("S7").ravel().astype(str).tolist())
+
+
+@functools.lru_cache(maxsize=32)
+def _build_swatch_image(colors: tuple, vertical: bool) -> np.ndarray:
+    """Return the RGBA image of a colour swatch with one pixel per colour."""
+    rgba = mpl.colors.to_rgba_array(colors)
+    return rgba[:, np.newaxis, :] if vertical else rgba[np.newaxis, :, :]
 
 
 def palettable_help() -> None:
     """Print helt text about the `palettable` package."""
+    import palettable  # noqa: PLC0415
+
     print(
         "This package includes `palettable` as a dependency, but do not implement any"
         " of its colour maps. Rather, have a look at their documentation at"
@@ -213,6 +305,7 @@ def make_color_swatch(  # noqa: PLR0913
     ratio: int = 8,
     no_border: bool = False,
     no_ticks: bool = True,
+    backend: Literal["imshow", "waffle"] = "imshow",
 ) -> mpl.axes.Axes:
     """Create a color swatch on the given axis object from the given color map.
 
@@ -240,6 +333,10 @@ def make_color_swatch(  # noqa: PLR0913
     no_ticks : bool
         Remove all tick marks, but keep the border. Default is ``True``. See
         ``plt.Axes.set_xticks`` and ``plt.Axes.set_yticks``.
+    backend : Literal["imshow", "waffle"]
+        How a ``list`` of colours is drawn. The default, ``"imshow"``, draws the colours
+        as one image, while ``"waffle"`` uses ``pywaffle.Waffle.make_waffle``. Only
+        used when ``c_bar`` is a ``list``.
 
     Returns
     -------
@@ -291,7 +388,9 @@ def make_color_swatch(  # noqa: PLR0913
     >>> ax2.set_xticks(list(range(length)), [f"No: {i}" for i in range(length)])
     >>> plt.show()
     """
-    if isinstance(c_bar, list):
+    if isinstance(c_bar, list) and backend == "waffle":
+        import pywaffle  # noqa: PLC0415
+
         row_col = "columns" if vertical else "rows"
         kwarg = {row_col: 1}
         pywaffle.Waffle.make_waffle(
@@ -307,6 +406,11 @@ def make_color_swatch(  # noqa: PLR0913
             **kwarg,
         )
         ax.set_axis_on()
+    elif isinstance(c_bar, list):
+        key = _as_key(c_bar)
+        # Copy, so that the axes never shares the cached image.
+        image = _build_swatch_image(key, vertical).copy()
+        ax.imshow(image, aspect="auto", interpolation="nearest")
     else:
         gradient = np.linspace(0, 1, resolution)
         if resolution // ratio < 1:
@@ -315,9 +419,10 @@ def make_color_swatch(  # noqa: PLR0913
                 f" {resolution = } -> {ratio}"
             )
             resolution = ratio
-        gradient = np.vstack(tuple(gradient for _ in range(int(resolution // ratio))))
+        # A read-only view repeating the same row, no copies are made.
+        grid = np.broadcast_to(gradient, (int(resolution // ratio), gradient.size))
         ax.imshow(
-            gradient,
+            grid,
             cmap=c_bar,
             interpolation="nearest",
             origin="lower",
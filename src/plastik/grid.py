@@ -1,13 +1,16 @@
 """Create and manipulate grids, similar to sub-figure layouts."""
 
-import itertools
+import string
 from typing import Any, Literal
 
 import matplotlib.pyplot as plt
+import numpy as np
 from matplotlib.axes import Axes
 from matplotlib.figure import Figure
 from typing_extensions import Self
 
+_DEFAULT_LABELS = tuple(rf"$\mathrm{{({c})}}$" for c in string.ascii_lowercase)
+
 
 class FigureGrid:
     """Return a figure with axes appropriate for (rows, columns) sub-figures.
@@ -88,14 +91,15 @@ class FigureGrid:
                 raise ValueError(f"Unknown value for share_axes: {self._share_axes}")
 
     def _update_labels(self: Self) -> list[str]:
-        labels = (
-            [
-                rf"$\mathrm{{({chr(97 + ell)})}}$"
-                for ell in range(self.rows * self.columns)
-            ]
-            if not self._labels or len(self._labels) != int(self.rows * self.columns)
-            else self._labels.copy()
-        )
+        n = self.rows * self.columns
+        if not self._labels and not self._columns_first and n <= len(_DEFAULT_LABELS):
+            return list(_DEFAULT_LABELS[:n])
+        if self._labels and len(self._labels) == int(n):
+            labels = self._labels.copy()
+        elif n <= len(_DEFAULT_LABELS):
+            labels = list(_DEFAULT_LABELS[:n])
+        else:
+            labels = np.char.mod(r"$\mathrm{(%c)}$", np.arange(97, 97 + n)).tolist()
         return self._maybe_columns_first(labels)
 
     def _maybe_columns_first(
@@ -103,20 +107,9 @@ class FigureGrid:
     ) -> list:
         if not self._columns_first:
             return list_
-        if transpose:
-            list_ = [
-                list_[i * self.rows + j]
-                for j in range(self.rows)
-                for i in range(self.columns)
-            ]
-            return list_
-        grid = [
-            list_[i * self.columns : (i + 1) * self.columns] for i in range(self.rows)
-        ]
-        return [
-            grid[row][col]
-            for col, row in itertools.product(range(self.columns), range(self.rows))
-        ]
+        shape = (self.columns, self.rows) if transpose else (self.rows, self.columns)
+        order = np.arange(self.rows * self.columns).reshape(shape).T.ravel()
+        return np.asarray(list_, dtype=object)[order].tolist()
 
     def using(  # noqa: PLR0913
         self: Self,
@@ -140,7 +133,8 @@ class FigureGrid:
             is `(-0.2, 0.95)`.
         share_axes : Literal["x", "y", "both"] | bool | None
             Use a shared axis for the given direction. Default is `False`, meaning none
-            are shared.
+            are shared. Shared x-axes are linked within each column and shared y-axes
+            within each row, and only the outer axes keep their tick labels.
         columns_first : bool | None
             If the labels should be placed in a columns-first order. Default is `False`,
             meaning rows are numbered first.
@@ -181,40 +175,57 @@ class FigureGrid:
         """
         full_height, full_width = self._calculate_figsize()
         fig = plt.figure(figsize=(full_width, full_height * self._expand_top))
-        axes = []
+        n_cells = self.rows * self.columns
+        axes: list[Any] = [None] * n_cells
         labels = self._update_labels()
-        for r in range(self.rows):
-            if self._share_axes in {"x", "both", True}:
-                rel_height = 0.75 + 0.25 / self.rows / self._expand_top
-                height = 0.75 / self.rows / rel_height / self._expand_top
-                bottom_pad = 0.2 / self.rows / rel_height / self._expand_top
-                bottom = bottom_pad + height * (self.rows - 1 - r)
-            else:
-                bottom_pad = 0.2 / self.rows
-                height = 0.75 / self.rows / self._expand_top
-                bottom = bottom_pad + (self.rows - 1 - r) / self.rows / self._expand_top
-            for c in range(self.columns):
-                if self._share_axes in {"y", "both", True}:
-                    rel_width = 0.75 + 0.25 / self.columns
-                    width = 0.75 / self.columns / rel_width
-                    left_pad = 0.2 / self.columns / rel_width
-                    left = left_pad + width * c
-                else:
-                    left_pad = 0.2 / self.columns
-                    width = 0.75 / self.columns
-                    left = left_pad + c / self.columns
-                axes.append(fig.add_axes((left, bottom, width, height)))
-                if self._share_axes in {"x", "both", True} and r != self.rows - 1:
-                    axes[-1].set_xticklabels([])
-                if self._share_axes in {"y", "both", True} and c != 0:
-                    axes[-1].set_yticklabels([])
-                axes[-1].text(
-                    self._pos[0],
-                    self._pos[1],
-                    labels[self.columns * r + c],
-                    transform=axes[-1].transAxes,
-                    **kwargs,
-                )
+        share_x = self._share_axes in {"x", "both", True}
+        share_y = self._share_axes in {"y", "both", True}
+        rows_below = self.rows - 1 - np.arange(self.rows)
+        if share_x:
+            rel_height = 0.75 + 0.25 / self.rows / self._expand_top
+            height = 0.75 / self.rows / rel_height / self._expand_top
+            bottom_pad = 0.2 / self.rows / rel_height / self._expand_top
+            bottoms = bottom_pad + height * rows_below
+        else:
+            bottom_pad = 0.2 / self.rows
+            height = 0.75 / self.rows / self._expand_top
+            bottoms = bottom_pad + rows_below / self.rows / self._expand_top
+        cols_left = np.arange(self.columns)
+        if share_y:
+            rel_width = 0.75 + 0.25 / self.columns
+            width = 0.75 / self.columns / rel_width
+            left_pad = 0.2 / self.columns / rel_width
+            lefts = left_pad + width * cols_left
+        else:
+            left_pad = 0.2 / self.columns
+            width = 0.75 / self.columns
+            lefts = left_pad + cols_left / self.columns
+        # One (left, bottom, width, height) rectangle per cell, in row-major order.
+        left_grid, bottom_grid = np.meshgrid(lefts, bottoms)
+        rects = np.column_stack(
+            (
+                left_grid.ravel(),
+                bottom_grid.ravel(),
+                np.full(n_cells, width),
+                np.full(n_cells, height),
+            )
+        )
+        pos_x, pos_y = self._pos
+        for idx, rect in enumerate(rects.tolist()):
+            r, c = divmod(idx, self.columns)
+            # Share with the first axes of the same column (x) or row (y). Shared axes
+            # also share formatters, so inner labels are hidden per axes instead.
+            ax = fig.add_axes(
+                rect,
+                sharex=axes[c] if share_x and r else None,
+                sharey=axes[self.columns * r] if share_y and c else None,
+            )
+            if share_x and r != self.rows - 1:
+                ax.tick_params(axis="x", labelbottom=False)
+            if share_y and c != 0:
+                ax.tick_params(axis="y", labelleft=False)
+            ax.text(pos_x, pos_y, labels[idx], transform=ax.transAxes, **kwargs)
+            axes[idx] = ax
         axes = self._maybe_columns_first(axes, transpose=False)
         return fig, axes
 
@@ -3,7 +3,18 @@
 from typing import Any, Literal
 
 import matplotlib as mpl
-import numpy as np
+
+# The legend location and default anchor point for each side.
+_SIDE_TABLE: dict[str, tuple[str, tuple[float, float]]] = {
+    "top": ("upper center", (0.5, 1.05)),
+    "bottom": ("lower center", (0.5, -0.05)),
+    "right": ("center right", (1.04, 0.5)),
+    "left": ("center left", (-0.04, 0.5)),
+    "top right": ("upper right", (1.04, 1.05)),
+    "top left": ("upper left", (-0.04, 1.05)),
+    "bottom right": ("lower right", (1.04, -0.05)),
+    "bottom left": ("lower left", (-0.04, -0.05)),
+}
 
 
 def topside_legends(  # noqa: PLR0913
@@ -70,32 +81,18 @@ def topside_legends(  # noqa: PLR0913
     Raises
     ------
     ValueError
-        If the first parameter is a string type (should be an axis Artist).
+        If the first parameter is a string type (should be an axis Artist), or if
+        ``side`` is not one of the valid sides.
     """
-    _sides = {
-        "top": "upper center",
-        "bottom": "lower center",
-        "right": "center right",
-        "left": "center left",
-        "top right": "upper right",
-        "top left": "upper left",
-        "bottom right": "lower right",
-        "bottom left": "lower left",
-    }
-    _anchors = {
-        "top": (0.5, 1.05),
-        "bottom": (0.5, -0.05),
-        "right": (1.04, 0.5),
-        "left": (-0.04, 0.5),
-        "top right": (1.04, 1.05),
-        "top left": (-0.04, 1.05),
-        "bottom right": (1.04, -0.05),
-        "bottom left": (-0.04, -0.05),
-    }
-    loc = _sides[side]
+    try:
+        loc, side_anchor = _SIDE_TABLE[side]
+    except KeyError as e:
+        raise ValueError(
+            f"Unknown side {side!r}, must be one of {', '.join(_SIDE_TABLE)}."
+        ) from e
     edgecolor = kwargs.pop("ec", edgecolor)
     facecolor = kwargs.pop("fc", facecolor)
-    anchor = anchor_ or _anchors[side]
+    anchor = anchor_ or side_anchor
     if args and isinstance(args[0][0], str):
         raise ValueError(
             "The first args parameter must be a sequence of Artist, not str."
@@ -107,8 +104,8 @@ def topside_legends(  # noqa: PLR0913
             # ax.legend() will re-set it to an empty legend. Therefore, we grab the list
             # and re-set it when we update the legend object.
             legend1: mpl.legend.Legend = ax.get_legend()
-            lst = [l_.get_text() for l_ in legend1.get_texts()]
-            l_d = len(legend1.get_texts())
+            lst: tuple[str, ...] = tuple(l_.get_text() for l_ in legend1.get_texts())
+            l_d = len(lst)
         except AttributeError:
             # If, however, the labels are set when creating the lines objects (e.g.
             # ax.plot(x, y, label="Label for (x, y) data")), we first make sure the
@@ -117,15 +114,14 @@ def topside_legends(  # noqa: PLR0913
             # labels.
             ax.legend()
             legend2: mpl.legend.Legend = ax.get_legend()
-            lst = []  # The empty list is falsy.
+            lst = ()  # The empty tuple is falsy.
             l_d = len(legend2.get_texts())
     else:
-        lst = list(args[1])
+        lst = tuple(args[1])
         l_d = len(args[1])
-    n_row = int(np.ceil(l_d / c_max))
-    n_col = 1
-    while l_d > n_col * n_row:
-        n_col += 1
+    # Ceiling divisions: the fewest rows, then the fewest columns that fit all labels.
+    n_row = -(-l_d // c_max)
+    n_col = -(-l_d // n_row) if n_row else 1
     if args:
         leg = ax.legend(
             args[0],
@@ -1,16 +1,34 @@
 """Creates a ridge plot figure."""
 
-import itertools
-from typing import Any
+from contextlib import nullcontext
+from typing import TYPE_CHECKING, Any
 
 import attr
 import matplotlib as mpl
-import matplotlib.gridspec as grid_spec
 import matplotlib.pyplot as plt
 import numpy as np
+from matplotlib.collections import LineCollection
 
 import plastik
 
+if TYPE_CHECKING:
+    from matplotlib.typing import RcKeyType
+
+_NO_TICKS: "dict[RcKeyType, Any]" = {
+    "xtick.bottom": False,
+    "xtick.top": False,
+    "ytick.left": False,
+    "ytick.right": False,
+    "xtick.labelbottom": False,
+    "ytick.labelleft": False,
+}
+
+_LABEL_TICKS: "dict[RcKeyType, Any]" = {
+    **_NO_TICKS,
+    "ytick.labelleft": True,
+    "ytick.labelcolor": "w",
+}
+
 
 @attr.s(auto_attribs=True)
 class Ridge:
@@ -44,6 +62,16 @@ class Ridge:
     kwargs : Dict
         Any keyword argument plt.plot accepts. (Need to be a dict, asterisk syntax not
         supported.)
+    collection : bool
+        Draw all ridges as one ``LineCollection`` on a single axes, which is much faster
+        when there are many ridges. Only used together with the 'b' option, the 'plot'
+        pltype and no ylim or kwargs. The single axes is then the only one in
+        ``all_axes``, and ``lines`` holds stand-in lines for creating a legend.
+    backend : str | None
+        A matplotlib backend to switch to before the figure is created, for example
+        'Agg' when the figure is only saved to file and never shown. Note that this
+        changes the backend used by ``pyplot`` for the rest of the session. Defaults to
+        None, keeping the current backend.
     """
 
     data: list[Any] = attr.ib()
@@ -55,6 +83,16 @@ class Ridge:
                 "data must be a list of tuples or numpy arrays, not list of"
                 f" {type(self.data[0])}."
             )
+        # Subclasses such as masked arrays and named tuples are fine, only the two
+        # kinds of data cannot be mixed.
+        is_tuple = isinstance(value[0], tuple)
+        if not all(
+            isinstance(d, tuple) if is_tuple else isinstance(d, np.ndarray)
+            for d in value
+        ):
+            raise TypeError(
+                "data must be a list of only tuples or only numpy arrays, not a mix."
+            )
 
     options: str = attr.ib(converter=str)
     y_scale: float = attr.ib(converter=float, default=1.0)
@@ -64,26 +102,69 @@ class Ridge:
     ylim: list[float] = attr.Factory(list)
     pltype: str = attr.ib(converter=str, default="plot")
     kwargs: dict[str, Any] = attr.Factory(dict)
-    colors = itertools.cycle(plt.rcParams["axes.prop_cycle"].by_key()["color"])
+    collection: bool = attr.ib(converter=bool, kw_only=True, default=False)
+    backend: str | None = attr.ib(kw_only=True, default=None)
+
+    def __attrs_post_init__(self) -> None:
+        """Prepare the colours and the data for plotting.
+
+        The colours are taken from the style that is active at creation. The data are
+        converted to arrays, and the kind of data and the y-range of each ridge are
+        stored for later use.
+        """
+        self._color_list = tuple(plt.rcParams["axes.prop_cycle"].by_key()["color"])
+        self._is_tuple_data = isinstance(self.data[0], tuple)
+        # Wrap the data as arrays once, keeping masked arrays, and reduce each ridge to
+        # its y-range once.
+        if self._is_tuple_data:
+            self.data = [(np.asanyarray(x), np.asanyarray(y)) for x, y in self.data]
+            ys = [y for _, y in self.data]
+        else:
+            self.data = [np.asanyarray(y) for y in self.data]
+            ys = self.data
+        self._mins = np.array([y.min() for y in ys])
+        self._maxs = np.array([y.max() for y in ys])
 
     def set_grid(self) -> None:
         """Set the gridstructure of the figure."""
-        fsize = (4, self.y_scale * len(self.data))
-        self.gs = grid_spec.GridSpec(len(self.data), 1)
+        self.__read_options()
+        fsize = (4, self.y_scale * self.__n)
+        if self.backend is not None:
+            mpl.use(self.backend, force=True)
         self.__fig = plt.figure(figsize=fsize)
-        # Set line type of horizontal grid lines
-        self.gls = itertools.cycle(["-", "--"])
-        self.ax_objs: list[mpl.axes.Axes] = []
-        if "z" in self.options:
+        self.gs = self.__fig.add_gridspec(self.__n, 1)
+        if self.__has_z:
             self.gs.update(hspace=-0.5)
         else:
             self.gs.update(hspace=0.0)
+        # Create all ridges at once, sharing the x-axis. Blank ridges never show
+        # ticks, so do not create them with the axes.
+        no_ticks = plt.rc_context(_NO_TICKS) if self.__has_b else nullcontext()
+        self.ax_objs: list[mpl.axes.Axes]
+        with no_ticks:
+            if self.__use_collection():
+                # All ridges are drawn on one axes that covers the whole grid
+                self.ax_objs = [self.__fig.add_subplot(self.gs[:, 0])]
+            else:
+                self.ax_objs = list(self.gs.subplots(sharex=True, squeeze=False)[:, 0])
+
+    def __read_options(self) -> None:
+        # Evaluated once per figure, and used by every ridge
+        self.__n = len(self.data)
+        self.__has_b = "b" in self.options
+        self.__has_g = "g" in self.options
+        self.__has_s = "s" in self.options
+        self.__has_z = "z" in self.options
+        # The spines between neighbouring ridges are hidden. (The spines proxy only
+        # takes lists, not tuples.)
+        inner = [["top", "bottom"] for _ in range(self.__n - 2)]
+        self.__spines = [["bottom"], *inner, ["top"]] if self.__n > 1 else [["bottom"]]
 
     def set_xaxs(self) -> None:
         """Set the x-axis limits."""
         if self.xlim:
             x_min, x_max = self.xlim
-        elif len(self.data[0]) != 2:  # noqa: PLR2004
+        elif not self._is_tuple_data:
             x_min, x_max = -0.5, len(self.data[0]) - 0.5
             x_min = 0.5 if self.pltype in ["loglog", "semilogx"] else x_min
         elif "c" in self.options:
@@ -97,19 +178,15 @@ class Ridge:
         self, y_min: float | None = None, y_max: float | None = None
     ) -> None:
         """Set the y-axis label."""
+        if not self.ylabel:
+            return
         if y_min is None or y_max is None:
-            self.ax = self.__fig.add_subplot(111, frame_on=False)
-            self.ax.tick_params(
-                labelcolor="w",
-                axis="both",
-                which="both",
-                zorder=-1,  # labelleft=False,
-                labelbottom=False,
-                top=False,
-                bottom=False,
-                left=False,
-                right=False,
-            )
+            # Only the y tick labels are created, as invisible space for the label
+            with plt.rc_context(_LABEL_TICKS):
+                self.ax = self.__fig.add_subplot(111, frame_on=False)
+            # Keep the label axes behind the ridges, which are created before it.
+            self.ax.set_zorder(-1)
+            self.ax.tick_params(axis="both", which="both", zorder=-1)
             plt.setp(self.ax.get_yticklabels(), alpha=0)
         else:
             self._set_ymin_ymax(y_min, y_max)
@@ -127,11 +204,9 @@ class Ridge:
         ylim = self.ylim or (y_min, y_max)
         self.ax.set_ylim(tuple(ylim))
 
-    def __blank(self) -> None:
-        spine = ["top", "bottom", "left", "right"]
-        for sp in spine:
-            self.ax_objs[-1].spines[sp].set_visible(False)
-        plt.tick_params(
+    def __blank(self, i) -> None:
+        self.ax_objs[i].spines[:].set_visible(False)
+        self.ax_objs[i].tick_params(
             axis="both",
             which="both",
             bottom=False,
@@ -144,46 +219,46 @@ class Ridge:
 
     def __z_option(self, i) -> None:
         if i % 2:
-            self.ax_objs[-1].tick_params(
+            self.ax_objs[i].tick_params(
                 axis="y",
                 which="both",
                 left=False,
                 labelleft=False,
                 labelright=True,
             )
-            self.ax_objs[-1].spines["left"].set_color("k")
+            self.ax_objs[i].spines["left"].set_color("k")
         else:
-            self.ax_objs[-1].tick_params(
+            self.ax_objs[i].tick_params(
                 axis="y",
                 which="both",
                 right=False,
                 labelleft=True,
                 labelright=False,
             )
-            self.ax_objs[-1].spines["right"].set_color("k")
+            self.ax_objs[i].spines["right"].set_color("k")
 
     def __s_option(self, i) -> None:
         if i % 2:
-            self.ax_objs[-1].tick_params(
+            self.ax_objs[i].tick_params(
                 axis="y", which="both", labelleft=False, labelright=True
             )
 
     def __g_option(self, i) -> None:
-        if ("g" in self.options and "z" not in self.options) or (
-            "g" in self.options and len(self.data) == 1
-        ):
+        if (self.__has_g and not self.__has_z) or (self.__has_g and self.__n == 1):
             plt.grid(True, which="major", ls="-", alpha=0.2)
-        elif "g" in self.options:
+        elif self.__has_g:
             plt.minorticks_off()
-            alpha = 0.2 if i in (0, len(self.data) - 1) else 0.1
-            plt.grid(True, axis="y", which="major", ls=next(self.gls), alpha=0.2)
+            alpha = 0.2 if i in (0, self.__n - 1) else 0.1
+            # Alternate the line type of horizontal grid lines
+            ls = "-" if i % 2 == 0 else "--"
+            plt.grid(True, axis="y", which="major", ls=ls, alpha=0.2)
             plt.grid(True, axis="x", which="major", ls="-", alpha=alpha)
 
     def __resolve_first_last_axis(self, i) -> None:
-        if i == len(self.data) - 1:
+        if i == self.__n - 1:
             if self.xlabel:
                 plt.xlabel(self.xlabel)
-            if len(self.data) != 1:
+            if self.__n != 1:
                 plt.tick_params(axis="x", which="both", top=False)
         elif i == 0:
             plt.tick_params(
@@ -195,102 +270,123 @@ class Ridge:
             )
 
     def __resolve_options(self, i, spines, col) -> None:
-        if len(self.data) != 1:
-            if "z" in self.options:  # Squeeze
+        if self.__n != 1:
+            if self.__has_z:  # Squeeze
                 self.__z_option(i)
-            elif "s" in self.options:  # Slalom axis
+            elif self.__has_s:  # Slalom axis
                 self.__s_option(i)
-            for sp in spines:
-                self.ax_objs[-1].spines[sp].set_visible(False)
-            if "z" not in self.options:  # Squeeze
-                self.ax_objs[-1].spines["left"].set_color(col)
-                self.ax_objs[-1].spines["right"].set_color(col)
-            self.ax_objs[-1].tick_params(axis="y", which="both", colors=col)
-            self.ax_objs[-1].yaxis.label.set_color(col)
+            self.ax_objs[i].spines[spines].set_visible(False)
+            if not self.__has_z:  # Squeeze
+                self.ax_objs[i].spines[["left", "right"]].set_color(col)
+            self.ax_objs[i].tick_params(axis="y", which="both", colors=col)
+            self.ax_objs[i].yaxis.label.set_color(col)
         self.__g_option(i)
         self.__resolve_first_last_axis(i)
 
-    def __setup_axis(
-        self,
-        y_min: float,
-        y_max: float,
-        i: int,
-        s: tuple[np.ndarray, np.ndarray] | np.ndarray,
-    ) -> tuple[float, float, tuple[np.ndarray, np.ndarray] | np.ndarray, list[str]]:
-        self.ax_objs.append(self.__fig.add_subplot(self.gs[i : i + 1, 0:]))
-        if i == 0:
-            spines = ["bottom"]
-        elif i == len(self.data) - 1:
-            spines = ["top"]
-        else:
-            spines = ["top", "bottom"]
-        s_ = s if isinstance(s, np.ndarray) else s[1]
-        y_min = min(s_.min(), y_min)
-        y_max = max(s_.max(), y_max)
-        return y_min, y_max, s, spines
-
-    def __draw_lines(self, s, col) -> None:
+    def __draw_lines(self, p_func, i, s, col) -> None:
         # Plot data
-        p_func = getattr(self.ax_objs[-1], self.pltype)
-        if len(s) == 2:  # noqa: PLR2004
-            ell = p_func(s[0], s[1], color=col, markersize=2.5, **self.kwargs)[0]
+        ax = self.ax_objs[i]
+        if self._is_tuple_data:
+            ell = p_func(ax, s[0], s[1], color=col, markersize=2.5, **self.kwargs)[0]
         else:
-            ell = p_func(s, color=col, markersize=2.5, **self.kwargs)[0]
+            ell = p_func(ax, s, color=col, markersize=2.5, **self.kwargs)[0]
 
         # Append in line-list to create legend
         self.__lines.append(ell)
 
+    def __use_collection(self) -> bool:
+        return (
+            self.collection
+            and self.__has_b
+            and self.pltype == "plot"
+            and not self.ylim
+            and not self.kwargs
+        )
+
+    def __draw_collection(self) -> None:
+        ax = self.ax_objs[0]
+        self.__blank(0)
+        ax.patch.set_alpha(0)
+        grid_box = self.gs[:, 0].get_position(self.__fig)
+        margin = plt.rcParams["axes.ymargin"]
+        segments = []
+        for i, s in enumerate(self.data):
+            x, y = s if self._is_tuple_data else (np.arange(len(s)), s)
+            # Place each ridge in its own band, scaled as its own axes would be
+            lo, hi = mpl.transforms.nonsingular(self._mins[i], self._maxs[i])
+            lo, hi = lo - margin * (hi - lo), hi + margin * (hi - lo)
+            band = self.gs[i, 0].get_position(self.__fig)
+            y_band = band.y0 - grid_box.y0 + (y - lo) / (hi - lo) * band.height
+            segments.append(np.ma.column_stack((x, y_band / grid_box.height)))
+        cols = [self._color_list[i % len(self._color_list)] for i in range(self.__n)]
+        ax.add_collection(LineCollection(segments, colors=cols))
+        ax.set_xlim(self.__xmin, self.__xmax)
+        ax.set_ylim(0, 1)
+        self.__lines.extend(mpl.lines.Line2D([], [], color=col) for col in cols)
+
+    def _compute_ylim(self) -> tuple[float, float]:
+        """Return the smallest and largest y-value across all ridges."""
+        return self._mins.min(), self._maxs.max()
+
     def data_loop(self) -> tuple[float, float]:
         """Run the data loop."""
         # Loop through data
         self.__lines: list[mpl.lines.Line2D] = []
-        y_min = np.inf
-        y_max = -np.inf
+        y_min, y_max = self._compute_ylim()
+        if self.__use_collection():
+            self.__draw_collection()
+            return y_min, y_max
+        # The same plotting method is used on every ridge, so look it up once
+        p_func = getattr(type(self.ax_objs[0]), self.pltype)
         for i, s in enumerate(self.data):
-            col = next(self.colors)
-            y_min, y_max, s_, spines = self.__setup_axis(y_min, y_max, i, s)
-            self.__draw_lines(s_, col)
-            self.ax_objs[-1].patch.set_alpha(0)
-            # Scale all subplots to the same x axis
-            plt.xlim([self.__xmin, self.__xmax])
-            if self.ylim:
-                plt.ylim(self.ylim)
+            col = self._color_list[i % len(self._color_list)]
+            # The ridges already exist, make this one current for the plt calls.
+            plt.sca(self.ax_objs[i])
+            spines = self.__spines[i]
+            self.__draw_lines(p_func, i, s, col)
+            # Only ridges that overlap or touch need to see through each other
+            if self.__has_z or self.__n > 1:
+                self.ax_objs[i].patch.set_alpha(0)
 
             # The length of data is greater than one, fix the plot according to the
             # input args and kwargs.
-            if "b" in self.options:
-                self.__blank()
+            if self.__has_b:
+                self.__blank(i)
             else:
                 self.__resolve_options(i, spines, col)
+        # Scale all subplots to the same x axis, which is shared by all ridges
+        self.ax_objs[0].set_xlim(self.__xmin, self.__xmax)
+        if self.ylim:
+            for ax in self.ax_objs:
+                ax.set_ylim(self.ylim)
         return y_min, y_max
 
     def __x_limit(self, maxx=True) -> tuple[float, float]:
-        if isinstance(self.data[0], tuple):
+        if self._is_tuple_data:
             data: list[np.ndarray] = [d[0] for d in self.data]
         else:
             raise ValueError("'data' must have x-values.")
-        t_min = data[0]
-        x_max = data[0][-1]
-        for t in data[1:]:
-            t_0, t_max = np.min(t), np.max(t)
-            if maxx:
-                t_min = t if t_0 < t_min[0] else t_min
-                # t_max = t if t_1 > t_max[-1] else t_max
-                x_max = max(t_max, x_max)
-            else:
-                t_min = t if t[0] > t_min[0] else t_min
-                # t_max = t if t[-1] < t_max[-1] else t_max
-                x_max = min(t_max, x_max)
-        diff = 0.05 * (x_max - t_min[0])
-        # x_max = t_max[-1] + diff
-        x_max += diff
-        if self.pltype in ["loglog", "semilogx"]:
-            x_min = 0.8 * t_min[t_min > 0][0] if t_min[0] < diff else t_min[0] - diff
-            # if x_min < 0:
-            #     x_min = 1e-10
+        # The x-values are sorted, so the first value is the smallest.
+        heads = np.fromiter((t[0] for t in data), dtype=float, count=len(data))
+        tails = np.fromiter((t.max() for t in data), dtype=float, count=len(data))
+        if maxx:
+            t_min = data[int(heads.argmin())]
+            x_max = tails.max()
         else:
-            x_min = t_min[0] - diff
-        return x_min, x_max
+            t_min = data[int(heads.argmax())]
+            x_max = tails.min()
+        diff = 0.05 * (x_max - t_min[0])
+        x_min = t_min[0] - diff
+        # A log axis cannot extend below zero, so start it at the first positive x.
+        if self.pltype in ["loglog", "semilogx"] and t_min[0] < diff:
+            positive = t_min[t_min > 0]
+            if not positive.size:
+                raise ValueError(
+                    f"pltype {self.pltype!r} uses a log x-axis, but there are no"
+                    " positive x-values."
+                )
+            x_min = 0.8 * positive[0]
+        return x_min, x_max + diff
 
     @property
     def lines(self) -> list:
@@ -323,14 +419,19 @@ class Ridge:
         return self.ax_objs
 
     def main(self) -> None:
-        """Run the main function."""
-        self.set_grid()
-        self.set_xaxs()
-        if self.ylabel:
-            self.set_ylabel()
-        y1, y2 = self.data_loop()
-        if self.ylabel:
-            self.set_ylabel(y1, y2)
+        """Run the main function.
+
+        Interactive mode is turned off while the figure is built, so that nothing is
+        drawn before the figure is shown or saved.
+        """
+        with plt.ioff():
+            self.set_grid()
+            self.set_xaxs()
+            if self.ylabel:
+                self.set_ylabel()
+            y1, y2 = self.data_loop()
+            if self.ylabel:
+                self.set_ylabel(y1, y2)
 
 
 if __name__ == "__main__":